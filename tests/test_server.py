@@ -9,11 +9,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.filesystem_server.server import (
     read_file,
+    read_files,
+    read_file_range,
+    file_resource,
     list_directory,
     search_files,
     file_monitor_handler,
     is_safe_path,
     WORKSPACE_ROOT,
+    _literal_anchor,
+    _compile_user_pattern,
+    _re2,
 )
 from mcp import McpError
 
@@ -94,6 +100,89 @@ def test_read_file_unsafe_path(monkeypatch):
     
     assert "Access denied" in str(excinfo.value)
 
+# Tests for read_files
+def test_read_files_success(temp_dir, monkeypatch):
+    """Test reading several files in one batch."""
+    # Mock is_safe_path to return True
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: True)
+
+    paths = [
+        os.path.join(temp_dir, "file1.txt"),
+        os.path.join(temp_dir, "file2.txt"),
+    ]
+    results = read_files(paths)
+
+    assert len(results) == 2
+    assert results[0]["path"] == paths[0]
+    assert results[0]["content"] == "Content of file1"
+    assert results[1]["content"] == "Content of file2"
+    assert "error" not in results[0]
+
+def test_read_files_missing_file(temp_dir, monkeypatch):
+    """Test that a missing file yields an error entry, not a failed batch."""
+    # Mock is_safe_path to return True
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: True)
+
+    paths = [
+        os.path.join(temp_dir, "file1.txt"),
+        os.path.join(temp_dir, "no_such_file.txt"),
+    ]
+    results = read_files(paths)
+
+    assert results[0]["content"] == "Content of file1"
+    assert "File not found" in results[1]["error"]
+    assert "content" not in results[1]
+
+def test_read_files_unsafe_path(monkeypatch):
+    """Test that an unsafe path yields an error entry."""
+    # Mock is_safe_path to return False
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: False)
+
+    results = read_files(["/etc/passwd"])
+
+    assert "Access denied" in results[0]["error"]
+    assert "content" not in results[0]
+
+# Tests for read_file_range
+def test_read_file_range_success(temp_file, monkeypatch):
+    """Test reading byte ranges of a file."""
+    # Mock is_safe_path to return True
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: True)
+
+    assert read_file_range(temp_file, 0, 4) == "Test"
+    assert read_file_range(temp_file, 5, 7) == "content"
+
+def test_read_file_range_negative_length(temp_file, monkeypatch):
+    """Test that a negative length is rejected instead of reading everything."""
+    # Mock is_safe_path to return True
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: True)
+
+    with pytest.raises(McpError) as excinfo:
+        read_file_range(temp_file, 0, -1)
+
+    assert "non-negative" in str(excinfo.value)
+
+# Tests for the file resource
+def test_file_resource_success(temp_file, monkeypatch):
+    """Test serving raw file bytes."""
+    # Mock is_safe_path to return True
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: True)
+
+    data = file_resource(temp_file)
+
+    assert isinstance(data, bytes)
+    assert b"pattern123" in data
+
+def test_file_resource_unsafe_path(monkeypatch):
+    """Test serving a file with an unsafe path."""
+    # Mock is_safe_path to return False
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: False)
+
+    with pytest.raises(McpError) as excinfo:
+        file_resource("/etc/passwd")
+
+    assert "Access denied" in str(excinfo.value)
+
 # Tests for list_directory
 def test_list_directory_success(temp_dir, monkeypatch):
     """Test successful directory listing."""
@@ -174,6 +263,68 @@ def test_search_files_unsafe_path(monkeypatch):
     
     assert "Access denied" in str(excinfo.value)
 
+def test_search_files_bounded_quantifier(temp_dir, monkeypatch):
+    """Test searching with a {n} repetition in the pattern."""
+    # Mock is_safe_path to return True
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: True)
+
+    with open(os.path.join(temp_dir, "repeat.txt"), "w") as f:
+        f.write("abbc\nnothing here\n")
+
+    results = search_files("ab{2}c", temp_dir)
+
+    assert len(results) == 1
+    assert results[0]["line"] == 1
+
+def test_search_files_crlf_line_anchor(temp_dir, monkeypatch):
+    """Test that $-anchored patterns match lines of CRLF files."""
+    # Mock is_safe_path to return True
+    monkeypatch.setattr("src.filesystem_server.server.is_safe_path", lambda path: True)
+
+    with open(os.path.join(temp_dir, "crlf.txt"), "wb") as f:
+        f.write(b"foo marker\r\nmiddle line\r\n")
+
+    results = search_files("marker$", temp_dir, include_content=True)
+
+    assert len(results) == 1
+    assert results[0]["content"] == "foo marker"
+
+# Tests for the search helpers
+def test_literal_anchor_plain_literal():
+    """Test anchor extraction from a fully literal pattern."""
+    assert _literal_anchor("pattern123") == "pattern123"
+
+def test_literal_anchor_bounded_repetition():
+    """Test that repetition bounds don't leak into the anchor."""
+    # The anchor must appear in any text the pattern matches
+    assert _literal_anchor("ab{2}c") in "abbc"
+    assert _literal_anchor("[0-9]{3}-[0-9]{4}") in "555-1234"
+
+def test_literal_anchor_class_with_leading_bracket():
+    """Test a character class whose first member is ']'."""
+    assert _literal_anchor("[]x]foo") in "]foo"
+
+def test_literal_anchor_class_with_escaped_bracket():
+    """Test a character class containing an escaped ']'."""
+    assert _literal_anchor(r"[ab\]c]") == ""
+    assert _literal_anchor(r"[ab\]c]end") == "end"
+
+def test_literal_anchor_alternation_disabled():
+    """Test that alternation disables the anchor entirely."""
+    assert _literal_anchor("foo|bar") == ""
+
+def test_compile_user_pattern_accepts_bounded_repetition():
+    """Test that bounded {m,n} repetitions inside groups are allowed."""
+    compiled = _compile_user_pattern(r"(\d{1,3}\.){3}\d{1,3}")
+    assert compiled.search(b"addr is 10.0.0.1 here")
+
+@pytest.mark.skipif(_re2 is not None, reason="re2 matches these patterns in linear time")
+def test_compile_user_pattern_rejects_nested_quantifiers():
+    """Test that catastrophic-backtracking shapes are rejected."""
+    for pattern in ["(a+)+", "(a?)+", "(a*)*"]:
+        with pytest.raises(ValueError):
+            _compile_user_pattern(pattern)
+
 # Tests for file_monitor resource
 @pytest.mark.asyncio
 async def test_file_monitor_handler_success(temp_file):